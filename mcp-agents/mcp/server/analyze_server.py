@@ -4,19 +4,43 @@ Comprehensive Sei Network Analyzer MCP Server
 Provides detailed wallet analysis, network health monitoring, and address comparison tools.
 """
 
+import array
 import asyncio
 import json
 import sys
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-import statistics
+from typing import Dict, List, Optional, Any, Tuple
+import time
+from dataclasses import dataclass, field
 
+import numpy as np
 from mcp.server.fastmcp import FastMCP
 
+import scoring_kernels
+
 # Create server instance
 mcp = FastMCP("sei-network-analyzer")
 
 
+@dataclass
+class TxStats:
+    """Aggregates collected from a single pass over a wallet's transactions"""
+    tx_count: int = 0
+    amounts: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    total_amount: float = 0.0
+    avg_amount: float = 0.0
+    median_amount: float = 0.0
+    max_amount: float = 0.0
+    min_amount: float = 0.0
+    incoming: int = 0
+    outgoing: int = 0
+    staking_count: int = 0
+    staking_amount: float = 0  # int until a staking amount is added, as sum() of nothing
+    defi_count: int = 0
+    counterparty_hashes: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.uint64))  # 'from'/'to' fingerprints
+    unique_senders: int = 0  # distinct tx.get('from', '') values
+
+
 class SeiAnalyzer:
     """
     Comprehensive Sei Network Analyzer for wallet and transaction analysis
@@ -31,120 +55,88 @@ class SeiAnalyzer:
             "inflation_rate": 0.08      # 8% annual inflation
         }
     
-    def calculate_whale_score(self, balance: float, total_supply: float = 10_000_000_000) -> float:
-        """Calculate whale score based on token holdings"""
-        if balance <= 0:
-            return 0.0
-        
-        percentage_of_supply = (balance / total_supply) * 100
-        
-        if percentage_of_supply >= 1.0:
-            return 1.0  # Mega whale
-        elif percentage_of_supply >= 0.1:
-            return 0.9  # Large whale
-        elif percentage_of_supply >= 0.01:
-            return 0.7  # Medium whale
-        elif percentage_of_supply >= 0.001:
-            return 0.5  # Small whale
-        elif percentage_of_supply >= 0.0001:
-            return 0.3  # Dolphin
-        else:
-            return 0.1  # Fish
-    
-    def calculate_risk_factor(self, transactions: List[Dict], balance: float) -> float:
-        """Calculate risk factor based on transaction patterns"""
+    def collect_tx_stats(self, transactions: List[Dict]) -> TxStats:
+        """Walk the transaction list once and collect everything the scorers need"""
+        stats = TxStats(tx_count=len(transactions))
         if not transactions:
-            return 0.5  # Neutral risk for no transactions
-        
-        risk_factors = []
-        
-        # Transaction frequency analysis
-        tx_count = len(transactions)
-        if tx_count > 1000:
-            risk_factors.append(0.8)  # High frequency could be bot
-        elif tx_count > 100:
-            risk_factors.append(0.6)  # Medium frequency
-        else:
-            risk_factors.append(0.3)  # Low frequency
+            return stats
         
-        # Transaction amount analysis
-        amounts = [float(tx.get('amount', 0)) for tx in transactions]
-        if amounts:
-            avg_amount = statistics.mean(amounts)
-            max_amount = max(amounts)
-            
-            # High value transactions increase risk
-            if max_amount > balance * 0.5:
-                risk_factors.append(0.7)
-            elif avg_amount > balance * 0.1:
-                risk_factors.append(0.6)
-            else:
-                risk_factors.append(0.3)
+        # Packed C buffers rather than lists of Python objects; NumPy wraps them without copying
+        amounts = array.array('d')
+        counterparty_hashes = array.array('Q')
+        sender_hashes = array.array('Q')
+        staking_amounts = []
+        incoming = outgoing = staking_count = defi_count = 0
+        # Type strings come from a tiny vocabulary; lowercase each distinct one only once
+        staking_types = {}
+        address_hash = scoring_kernels.address_hash
         
-        # Pattern analysis
-        unique_counterparties = set()
         for tx in transactions:
+            amount = float(tx.get('amount', 0))
+            amounts.append(amount)
+            
+            tx_type = tx.get('type', '')
+            if tx_type == 'incoming':
+                incoming += 1
+            elif tx_type == 'outgoing':
+                outgoing += 1
+            is_staking = staking_types.get(tx_type)
+            if is_staking is None:
+                is_staking = staking_types[tx_type] = 'staking' in tx_type.lower()
+            if is_staking:
+                staking_count += 1
+                staking_amounts.append(amount)
+            
+            if tx.get('to', '').startswith('sei1'):
+                defi_count += 1
+            
+            sender = address_hash(tx.get('from', ''))
+            sender_hashes.append(sender)
             if 'from' in tx:
-                unique_counterparties.add(tx['from'])
+                counterparty_hashes.append(sender)
             if 'to' in tx:
-                unique_counterparties.add(tx['to'])
+                counterparty_hashes.append(address_hash(tx['to']))
         
-        counterparty_ratio = len(unique_counterparties) / max(tx_count, 1)
-        if counterparty_ratio < 0.1:
-            risk_factors.append(0.8)  # Very few counterparties - suspicious
-        elif counterparty_ratio < 0.3:
-            risk_factors.append(0.6)  # Limited counterparties
-        else:
-            risk_factors.append(0.3)  # Good distribution
+        arr = np.frombuffer(amounts, dtype=np.float64)
         
-        return min(statistics.mean(risk_factors), 1.0)
+        stats.amounts = arr
+        stats.counterparty_hashes = np.frombuffer(counterparty_hashes, dtype=np.uint64)
+        stats.unique_senders = np.unique(np.frombuffer(sender_hashes, dtype=np.uint64)).size
+        stats.total_amount = float(arr.sum())
+        stats.avg_amount = scoring_kernels.exact_mean(arr)
+        stats.median_amount = float(np.median(arr))
+        stats.max_amount = float(arr.max())
+        stats.min_amount = float(arr.min())
+        stats.incoming = incoming
+        stats.outgoing = outgoing
+        stats.staking_count = staking_count
+        # sum() rather than += in the loop: its compensated float summation is what baseline reported
+        stats.staking_amount = sum(staking_amounts)
+        stats.defi_count = defi_count
+        return stats
+    
+    def calculate_whale_score(self, balance: float, total_supply: float = 10_000_000_000) -> float:
+        """Calculate whale score based on token holdings"""
+        return scoring_kernels.whale_score(balance, total_supply)
+    
+    def calculate_risk_factor(self, stats: TxStats, balance: float) -> float:
+        """Calculate risk factor based on transaction patterns"""
+        return scoring_kernels.risk_factor(stats.amounts, stats.counterparty_hashes, balance)
     
-    def calculate_influence_score(self, transactions: List[Dict], balance: float) -> float:
+    def calculate_influence_score(self, stats: TxStats, balance: float) -> float:
         """Calculate on-chain influence based on transaction volume and network participation"""
-        if not transactions:
-            return 0.1
-        
-        # Volume-based influence
-        total_volume = sum(float(tx.get('amount', 0)) for tx in transactions)
-        volume_score = min(total_volume / (balance * 10), 1.0) * 0.4
-        
-        # Activity-based influence
-        tx_count = len(transactions)
-        activity_score = min(tx_count / 1000, 1.0) * 0.3
-        
-        # Network participation (based on unique interactions)
-        unique_addresses = set()
-        for tx in transactions:
-            if 'from' in tx:
-                unique_addresses.add(tx['from'])
-            if 'to' in tx:
-                unique_addresses.add(tx['to'])
-        
-        network_score = min(len(unique_addresses) / 100, 1.0) * 0.3
-        
-        return min(volume_score + activity_score + network_score, 1.0)
+        return scoring_kernels.influence_score(stats.amounts, stats.counterparty_hashes, balance)
     
-    def analyze_transaction_patterns(self, transactions: List[Dict]) -> Dict:
+    def analyze_transaction_patterns(self, stats: TxStats) -> Dict:
         """Analyze transaction patterns for insights"""
-        if not transactions:
+        if not stats.tx_count:
             return {"pattern": "no_activity", "description": "No transactions found"}
         
-        # Time-based analysis
-        tx_count = len(transactions)
-        
-        # Amount analysis
-        amounts = [float(tx.get('amount', 0)) for tx in transactions]
-        if amounts:
-            avg_amount = statistics.mean(amounts)
-            median_amount = statistics.median(amounts)
-            max_amount = max(amounts)
-            min_amount = min(amounts)
-        else:
-            avg_amount = median_amount = max_amount = min_amount = 0
-        
-        # Direction analysis
-        incoming = sum(1 for tx in transactions if tx.get('type') == 'incoming')
-        outgoing = sum(1 for tx in transactions if tx.get('type') == 'outgoing')
+        tx_count = stats.tx_count
+        avg_amount = stats.avg_amount
+        median_amount = stats.median_amount
+        incoming = stats.incoming
+        outgoing = stats.outgoing
         
         patterns = []
         
@@ -164,22 +156,20 @@ class SeiAnalyzer:
             "transaction_count": tx_count,
             "average_amount": avg_amount,
             "median_amount": median_amount,
-            "max_amount": max_amount,
+            "max_amount": stats.max_amount,
             "incoming_ratio": incoming / max(tx_count, 1),
             "outgoing_ratio": outgoing / max(tx_count, 1),
             "patterns": patterns
         }
     
-    def get_sei_specific_metrics(self, address: str, transactions: List[Dict]) -> Dict:
-        """Calculate Sei-specific metrics"""
+    def get_sei_specific_metrics(self, staking_count: int, staking_amount: float, defi_count: int, tx_count: int) -> Dict:
+        """Calculate Sei-specific metrics from the staking/DeFi aggregates of a TxStats"""
         
-        # Simulate staking analysis
-        staking_txs = [tx for tx in transactions if 'staking' in tx.get('type', '').lower()]
-        delegation_amount = sum(float(tx.get('amount', 0)) for tx in staking_txs)
+        # Staking analysis
+        delegation_amount = staking_amount
         
         # DeFi participation (simulate based on contract interactions)
-        defi_txs = [tx for tx in transactions if tx.get('to', '').startswith('sei1')]
-        defi_participation = len(defi_txs) > 0
+        defi_participation = defi_count > 0
         
         # Calculate SEI-specific scores
         sei_network_score = 0.5  # Base score
@@ -190,7 +180,7 @@ class SeiAnalyzer:
         if defi_participation:
             sei_network_score += 0.2  # Bonus for DeFi usage
         
-        if len(transactions) > 50:
+        if tx_count > 50:
             sei_network_score += 0.1  # Bonus for active usage
         
         return {
@@ -198,13 +188,47 @@ class SeiAnalyzer:
             "defi_participation": defi_participation,
             "sei_network_score": min(sei_network_score, 1.0),
             "estimated_rewards": delegation_amount * self.sei_metrics["inflation_rate"] * 0.85,  # 85% of inflation rate
-            "validator_interactions": len(staking_txs)
+            "validator_interactions": staking_count
         }
 
 
 # Initialize analyzer
 analyzer = SeiAnalyzer()
 
+# Timestamp string shared by responses generated within the same second
+_ts_cache = [0.0, ""]
+
+
+def _now_iso() -> str:
+    """Current local time in ISO format, regenerated at most once per second"""
+    now = time.monotonic()
+    if now - _ts_cache[0] > 1.0:
+        _ts_cache[:] = [now, datetime.now().isoformat()]
+    return _ts_cache[1]
+
+
+def _compute_scores(balance: float, stats: TxStats) -> Tuple[float, float, float, str]:
+    """Core scores and classification of a wallet: (whale_score, risk_factor, influence_score, classification)"""
+    whale_score = analyzer.calculate_whale_score(balance)
+    risk_factor = analyzer.calculate_risk_factor(stats, balance)
+    influence_score = analyzer.calculate_influence_score(stats, balance)
+    
+    # Classification
+    if whale_score >= 0.8:
+        classification = "Whale"
+    elif whale_score >= 0.5:
+        classification = "Large Holder"
+    elif influence_score >= 0.7:
+        classification = "Active Trader"
+    elif stats.defi_count > 0:
+        classification = "DeFi User"
+    elif stats.staking_amount > 0:
+        classification = "Staker"
+    else:
+        classification = "Regular User"
+    
+    return whale_score, risk_factor, influence_score, classification
+
 
 @mcp.tool()
 async def analyze_wallet(walletData: dict) -> dict:
@@ -226,70 +250,91 @@ async def analyze_wallet(walletData: dict) -> dict:
     balance = float(walletData.get('balance', 0))
     transactions = walletData.get('transactions', [])
     
+    # Single pass over the transactions shared by every scorer below
+    stats = analyzer.collect_tx_stats(transactions)
+    tx_count = stats.tx_count
+    
     # Core analysis
-    whale_score = analyzer.calculate_whale_score(balance)
-    risk_factor = analyzer.calculate_risk_factor(transactions, balance)
-    influence_score = analyzer.calculate_influence_score(transactions, balance)
+    whale_score, risk_factor, influence_score, classification = _compute_scores(balance, stats)
     
     # Pattern analysis
-    patterns = analyzer.analyze_transaction_patterns(transactions)
+    patterns = analyzer.analyze_transaction_patterns(stats)
     
     # Sei-specific metrics
-    sei_metrics = analyzer.get_sei_specific_metrics(address, transactions)
+    sei_metrics = analyzer.get_sei_specific_metrics(stats.staking_count, stats.staking_amount, stats.defi_count, tx_count)
     
     # Overall scoring
     overall_score = (whale_score * 0.3 + (1 - risk_factor) * 0.3 + influence_score * 0.4)
     
-    # Classification
-    if whale_score >= 0.8:
-        classification = "Whale"
-    elif whale_score >= 0.5:
-        classification = "Large Holder"
-    elif influence_score >= 0.7:
-        classification = "Active Trader"
-    elif sei_metrics["defi_participation"]:
-        classification = "DeFi User"
-    elif sei_metrics["staking_amount"] > 0:
-        classification = "Staker"
-    else:
-        classification = "Regular User"
-    
-    result = {
+    scores = {
+        "whale_score": round(whale_score, 3),
+        "risk_factor": round(risk_factor, 3),
+        "influence_score": round(influence_score, 3),
+        "overall_score": round(overall_score, 3),
+        "sei_network_score": round(sei_metrics["sei_network_score"], 3)
+    }
+    wallet_metrics = {
+        "balance_sei": balance,
+        "transaction_count": tx_count,
+        "estimated_usd_value": balance * 0.45,  # Approximate SEI price
+        "balance_percentage_of_supply": (balance / 10_000_000_000) * 100
+    }
+    risk_assessment = {
+        "level": "High" if risk_factor > 0.7 else "Medium" if risk_factor > 0.4 else "Low",
+        "factors": [f for f in [
+            "High transaction frequency" if tx_count > 1000 else None,
+            "Limited counterparties" if stats.unique_senders < tx_count * 0.1 else None,
+            "Large transaction amounts" if tx_count and stats.max_amount > balance * 0.5 else None
+        ] if f is not None]
+    }
+    recommendations = [r for r in [
+        "Monitor for wash trading" if risk_factor > 0.8 else None,
+        "Potential market maker" if influence_score > 0.8 and tx_count > 500 else None,
+        "Strong network participant" if sei_metrics["sei_network_score"] > 0.8 else None,
+        "Consider for validator program" if sei_metrics["staking_amount"] > 1000000 else None
+    ] if r is not None]
+    
+    return {
         "address": address,
-        "analysis_timestamp": datetime.now().isoformat(),
+        "analysis_timestamp": _now_iso(),
         "classification": classification,
-        "scores": {
-            "whale_score": round(whale_score, 3),
-            "risk_factor": round(risk_factor, 3),
-            "influence_score": round(influence_score, 3),
-            "overall_score": round(overall_score, 3),
-            "sei_network_score": round(sei_metrics["sei_network_score"], 3)
-        },
-        "wallet_metrics": {
-            "balance_sei": balance,
-            "transaction_count": len(transactions),
-            "estimated_usd_value": balance * 0.45,  # Approximate SEI price
-            "balance_percentage_of_supply": (balance / 10_000_000_000) * 100
-        },
+        "scores": scores,
+        "wallet_metrics": wallet_metrics,
         "transaction_patterns": patterns,
         "sei_specific": sei_metrics,
-        "risk_assessment": {
-            "level": "High" if risk_factor > 0.7 else "Medium" if risk_factor > 0.4 else "Low",
-            "factors": [f for f in [
-                "High transaction frequency" if len(transactions) > 1000 else None,
-                "Limited counterparties" if len(set(tx.get('from', '') for tx in transactions)) < len(transactions) * 0.1 else None,
-                "Large transaction amounts" if any(float(tx.get('amount', 0)) > balance * 0.5 for tx in transactions) else None
-            ] if f is not None]
-        },
-        "recommendations": [r for r in [
-            "Monitor for wash trading" if risk_factor > 0.8 else None,
-            "Potential market maker" if influence_score > 0.8 and len(transactions) > 500 else None,
-            "Strong network participant" if sei_metrics["sei_network_score"] > 0.8 else None,
-            "Consider for validator program" if sei_metrics["staking_amount"] > 1000000 else None
-        ] if r is not None]
+        "risk_assessment": risk_assessment,
+        "recommendations": recommendations
     }
-    
-    return result
+
+
+# Simulated network metrics; live RPC data will fill in the volatile fields
+_NETWORK_METRICS_TEMPLATE = {
+    "block_height": 12500000,
+    "block_time": 0.48,
+    "active_validators": 95,
+    "total_validators": 100,
+    "bonded_tokens": 6500000000,
+    "total_supply": 10000000000,
+    "current_inflation": 0.078,
+    "community_pool": 50000000
+}
+
+# Ratios derived from the slow-moving supply/validator figures, computed once at load
+_validator_ratio = _NETWORK_METRICS_TEMPLATE["active_validators"] / _NETWORK_METRICS_TEMPLATE["total_validators"]
+_staking_ratio = _NETWORK_METRICS_TEMPLATE["bonded_tokens"] / _NETWORK_METRICS_TEMPLATE["total_supply"]
+_HEALTH_CONSTANTS = {
+    "validator_ratio": _validator_ratio,
+    "staking_ratio": _staking_ratio,
+    # Validator and staking share of the health score; only the block-time term varies per call
+    "base_score": (_validator_ratio * 0.3) + (_staking_ratio * 0.4),
+    "validator_participation": f"{_validator_ratio:.1%}",
+    "network_security": "High" if _staking_ratio > 0.6 else "Medium",
+    "decentralization_score": round(_validator_ratio * _staking_ratio, 3),
+}
+
+# Chain metrics are volatile, so the fetched metrics and score are only reused briefly
+NETWORK_HEALTH_TTL = 3.0  # seconds
+_network_health_cache = [0.0, None]
 
 
 @mcp.tool()
@@ -304,42 +349,37 @@ async def analyze_network_health(networkData: dict = None) -> dict:
         dict: Network health analysis
     """
     
-    # Simulate real-time network metrics
-    current_metrics = {
-        "block_height": 12500000,
-        "block_time": 0.48,
-        "active_validators": 95,
-        "total_validators": 100,
-        "bonded_tokens": 6500000000,
-        "total_supply": 10000000000,
-        "current_inflation": 0.078,
-        "community_pool": 50000000
-    }
-    
-    # Health scoring
-    validator_ratio = current_metrics["active_validators"] / current_metrics["total_validators"]
-    staking_ratio = current_metrics["bonded_tokens"] / current_metrics["total_supply"]
+    now = time.monotonic()
+    if _network_health_cache[1] is None or now - _network_health_cache[0] >= NETWORK_HEALTH_TTL:
+        # Simulate real-time network metrics
+        current_metrics = _NETWORK_METRICS_TEMPLATE.copy()
+        
+        # Health scoring
+        block_time = current_metrics["block_time"]
+        network_health_score = _HEALTH_CONSTANTS["base_score"] + (1.0 if block_time < 1.0 else 0.8) * 0.3
+        
+        _network_health_cache[:] = [now, (current_metrics, network_health_score)]
     
-    network_health_score = (
-        (validator_ratio * 0.3) +
-        (staking_ratio * 0.4) +
-        (1.0 if current_metrics["block_time"] < 1.0 else 0.8) * 0.3
-    )
+    # Only the scalar inputs are reused; every caller gets freshly built dicts to own
+    current_metrics, network_health_score = _network_health_cache[1]
+    validator_ratio = _HEALTH_CONSTANTS["validator_ratio"]
+    staking_ratio = _HEALTH_CONSTANTS["staking_ratio"]
+    block_time = current_metrics["block_time"]
     
     health_status = "Excellent" if network_health_score > 0.9 else "Good" if network_health_score > 0.7 else "Fair"
     
-    result = {
+    return {
         "network_health": {
             "overall_score": round(network_health_score, 3),
             "status": health_status,
-            "last_updated": datetime.now().isoformat()
+            "last_updated": _now_iso()
         },
-        "metrics": current_metrics,
+        "metrics": dict(current_metrics),
         "analysis": {
-            "validator_participation": f"{validator_ratio:.1%}",
-            "network_security": "High" if staking_ratio > 0.6 else "Medium",
-            "block_performance": "Optimal" if current_metrics["block_time"] < 0.6 else "Good",
-            "decentralization_score": round(validator_ratio * staking_ratio, 3)
+            "validator_participation": _HEALTH_CONSTANTS["validator_participation"],
+            "network_security": _HEALTH_CONSTANTS["network_security"],
+            "block_performance": "Optimal" if block_time < 0.6 else "Good",
+            "decentralization_score": _HEALTH_CONSTANTS["decentralization_score"]
         },
         "recommendations": [r for r in [
             "Network is performing optimally" if network_health_score > 0.9 else None,
@@ -347,8 +387,6 @@ async def analyze_network_health(networkData: dict = None) -> dict:
             "Encourage more staking" if staking_ratio < 0.6 else None
         ] if r is not None]
     }
-    
-    return result
 
 
 @mcp.tool()
@@ -369,38 +407,55 @@ async def compare_addresses(addressData: dict) -> dict:
         return {"error": "At least 2 addresses required for comparison"}
     
     comparisons = []
+    whale_concentration = high_risk_addresses = 0
     
     for addr_data in addresses:
-        # Reuse the analyze_wallet logic
-        analysis = await analyze_wallet(addr_data)
+        # Only the core scores are compared, so skip the rest of the wallet analysis
+        balance = float(addr_data.get('balance', 0))
+        stats = analyzer.collect_tx_stats(addr_data.get('transactions', []))
+        whale_score, risk_factor, influence_score, classification = _compute_scores(balance, stats)
+        whale_score = round(whale_score, 3)
+        risk_factor = round(risk_factor, 3)
+        
+        # Insight counts use the reported (rounded) scores
+        if whale_score > 0.7:
+            whale_concentration += 1
+        if risk_factor > 0.7:
+            high_risk_addresses += 1
         
         comparisons.append({
             "address": addr_data.get('address', 'unknown'),
-            "whale_score": analysis["scores"]["whale_score"],
-            "risk_factor": analysis["scores"]["risk_factor"],
-            "influence_score": analysis["scores"]["influence_score"],
-            "classification": analysis["classification"],
-            "balance": float(addr_data.get('balance', 0)),
-            "tx_count": len(addr_data.get('transactions', []))
+            "whale_score": whale_score,
+            "risk_factor": risk_factor,
+            "influence_score": round(influence_score, 3),
+            "classification": classification,
+            "balance": balance,
+            "tx_count": stats.tx_count
         })
     
     # Find similarities and differences
     whale_scores = [c["whale_score"] for c in comparisons]
     risk_factors = [c["risk_factor"] for c in comparisons]
     
+    # Plain arithmetic over a handful of scores; statistics' exact-fraction path is overkill here
+    count = len(comparisons)
+    average_whale_score = sum(whale_scores) / count
+    average_risk = sum(risk_factors) / count
+    whale_score_stdev = (sum((w - average_whale_score) ** 2 for w in whale_scores) / (count - 1)) ** 0.5
+    
     result = {
         "comparison_summary": {
             "total_addresses": len(addresses),
             "highest_whale_score": max(whale_scores),
             "highest_risk": max(risk_factors),
-            "average_whale_score": round(statistics.mean(whale_scores), 3),
-            "average_risk": round(statistics.mean(risk_factors), 3)
+            "average_whale_score": round(average_whale_score, 3),
+            "average_risk": round(average_risk, 3)
         },
         "individual_analysis": comparisons,
         "insights": {
-            "whale_concentration": len([w for w in whale_scores if w > 0.7]),
-            "high_risk_addresses": len([r for r in risk_factors if r > 0.7]),
-            "potential_connections": "Manual review recommended" if statistics.stdev(whale_scores) < 0.1 else "No obvious connections"
+            "whale_concentration": whale_concentration,
+            "high_risk_addresses": high_risk_addresses,
+            "potential_connections": "Manual review recommended" if whale_score_stdev < 0.1 else "No obvious connections"
         }
     }
     
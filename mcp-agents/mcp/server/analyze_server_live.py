@@ -5,28 +5,74 @@ Uses live Sei blockchain data via Sei SDK and CosmPy
 """
 
 import asyncio
+import functools
+import heapq
+import importlib.util
 import json
+import logging
+import logging.handlers
+import math
+import queue
+import statistics
 import sys
+import time
+from collections import deque
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-import statistics
+from itertools import islice
+from typing import Dict, List, Optional, Any, Tuple, AsyncIterator, Awaitable, Callable, Iterator
+from urllib.parse import urlencode
 import os
 
+import numpy as np
+from cachetools import TTLCache
 from fastmcp import FastMCP
-import aiohttp
-import requests
+import httpx
 from cosmpy.aerial.client import LedgerClient, NetworkConfig
 from cosmpy.aerial.wallet import LocalWallet
 from cosmpy.crypto.keypairs import PrivateKey
 
+logger = logging.getLogger(__name__)
+
+# orjson parses the large transaction payloads several times faster; fall back to the stdlib parser
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# HTTP/2 multiplexes concurrent requests over one connection, but needs the optional h2 package
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+@functools.lru_cache(maxsize=4096)
+def _tx_search_path(event: str, address: str, limit: int) -> str:
+    """Tx search path with its query string encoded once per address, not on every request"""
+    query = urlencode({"events": f"{event}='{address}'", "limit": limit, "order_by": "ORDER_BY_DESC"})
+    return f"cosmos/tx/v1beta1/txs?{query}"
+
+@asynccontextmanager
+async def _lifespan(server):
+    """Close the analyzer's pooled HTTP connections when the server shuts down"""
+    try:
+        yield
+    finally:
+        await analyzer.aclose()
+
 # Initialize FastMCP server
-mcp = FastMCP("sei-network-analyzer-live")
+mcp = FastMCP("sei-network-analyzer-live", lifespan=_lifespan)
 
 class SeiLiveAnalyzer:
     """
     Live Sei Network Analyzer using real blockchain data
     """
     
+    # Cosmos message module (first two segments of a message "@type") -> transaction type
+    _TX_TYPE_MAP = {
+        "cosmos.staking": "staking",
+        "cosmos.gov": "governance",
+        "cosmos.distribution": "rewards"
+    }
+    
     def __init__(self):
         # Sei network configuration
         self.sei_rpc_endpoints = [
@@ -45,105 +91,269 @@ class SeiLiveAnalyzer:
         self.sei_chain_id = "pacific-1"
         self.sei_denom = "usei"  # micro SEI
         self.sei_decimals = 6
+        self._usei_divisor = 10 ** self.sei_decimals
+        self._denom_suffix_len = len(self.sei_denom)
         
-        # Cache for network data
-        self._network_cache = {}
+        # Cache for network data, refreshed in the background shortly before it expires
         self._cache_ttl = 300  # 5 minutes
+        self._network_cache = TTLCache(maxsize=16, ttl=self._cache_ttl)
+        self._network_refresh_ahead = 30  # seconds before expiry
+        self._network_lock = asyncio.Lock()
+        self._network_refresh_task: Optional[asyncio.Task] = None
+        self._network_fallback: Optional[Dict] = None  # Last good stats, served if a refresh fails
+        
+        # Per-address caches; balances and history move quickly, so entries expire sooner
+        self._wallet_cache = {}
+        self._account_cache = {}
+        self._tx_cache = {}
+        self._inflight: Dict[Tuple, asyncio.Future] = {}  # Fetches and analyses being computed
+        self._wallet_ttl = 30  # seconds
+        self._address_cache_size = 1024
+        
+        # Delay before a slow endpoint is hedged with the next fallback
+        self._hedge_delay = 0.3  # seconds
+        
+        # Measured endpoint latencies, refreshed in the background to try the fastest mirror first
+        self._endpoint_latency: Dict[str, float] = {}
+        self._latency_samples: Dict[str, deque] = {}
+        self._probe_interval = 60  # seconds
+        self._probe_task: Optional[asyncio.Task] = None
+        
+        # Shared HTTP client so requests reuse pooled keep-alive connections
+        self._client: Optional[httpx.AsyncClient] = None
+        
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60),
+                timeout=10.0
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Stop latency probing and close the shared HTTP client"""
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            self._probe_task = None
+        if self._network_refresh_task is not None:
+            self._network_refresh_task.cancel()
+            self._network_refresh_task = None
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        
+    def _cache_get(self, cache: Dict, key: Any, ttl: float) -> Any:
+        """Return a cached value younger than ttl seconds, or None"""
+        entry = cache.get(key)
+        if entry is None or time.time() - entry["timestamp"] >= ttl:
+            return None
+        cache[key] = cache.pop(key)  # Mark as most recently used
+        return entry["data"]
+    
+    def _cache_put(self, cache: Dict, key: Any, data: Any):
+        """Store a value in a per-address cache, evicting the least recently used entry"""
+        cache.pop(key, None)
+        cache[key] = {"timestamp": time.time(), "data": data}
+        if len(cache) > self._address_cache_size:
+            del cache[next(iter(cache))]
+    
+    async def _try(self, endpoint: str, path: str = "", params: Dict = None) -> Dict:
+        """Make a single HTTP request to one Sei endpoint"""
+        url = f"{endpoint.rstrip('/')}/{path.lstrip('/')}" if path else endpoint
+        
+        response = await self._get_client().get(url, params=params)
+        if response.status_code != 200:
+            raise Exception(f"HTTP {response.status_code}")
+        return _json_loads(response.content)
+    
+    async def _probe_endpoint(self, endpoint: str):
+        """Record the median of recent round-trip times to one endpoint"""
+        started = time.perf_counter()
+        try:
+            await self._try(endpoint, "cosmos/base/tendermint/v1beta1/syncing")
+            latency = time.perf_counter() - started
+        except Exception:
+            latency = math.inf
         
+        samples = self._latency_samples.setdefault(endpoint, deque(maxlen=5))
+        samples.append(latency)
+        self._endpoint_latency[endpoint] = statistics.median(samples)
+    
+    async def _probe_loop(self):
+        """Periodically measure the latency of every REST endpoint"""
+        while True:
+            await asyncio.gather(*(self._probe_endpoint(ep) for ep in self.sei_api_endpoints))
+            await asyncio.sleep(self._probe_interval)
+    
     async def _make_request(self, endpoints: List[str], path: str = "", params: Dict = None) -> Dict:
-        """Make HTTP request to Sei network with fallback endpoints"""
-        for endpoint in endpoints:
-            try:
-                url = f"{endpoint.rstrip('/')}/{path.lstrip('/')}" if path else endpoint
+        """Make HTTP request to Sei network, hedging slow endpoints with the fallbacks"""
+        if self._probe_task is None or self._probe_task.done():
+            self._probe_task = asyncio.create_task(self._probe_loop())
+        
+        # Fastest measured endpoint first; unprobed endpoints keep their configured order
+        remaining = sorted(endpoints, key=lambda ep: self._endpoint_latency.get(ep, math.inf))
+        pending = {}
+        try:
+            while remaining or pending:
+                # Start the next endpoint when nothing is in flight or the current ones are slow
+                if remaining:
+                    endpoint = remaining.pop(0)
+                    pending[asyncio.create_task(self._try(endpoint, path, params))] = endpoint
                 
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url, params=params, timeout=10) as response:
-                        if response.status == 200:
-                            return await response.json()
-            except Exception as e:
-                print(f"Failed to connect to {endpoint}: {e}")
-                continue
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=self._hedge_delay if remaining else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    endpoint = pending.pop(task)
+                    if task.exception() is None:
+                        return task.result()
+                    logger.warning("Failed to connect to %s: %s", endpoint, task.exception())
+        finally:
+            # Cancel the requests that lost the race
+            for task in pending:
+                task.cancel()
         
         raise Exception("All Sei endpoints failed")
     
+    def _single_flight(self, key: Tuple, fetch: Callable[[], Awaitable[Any]]) -> Awaitable[Any]:
+        """Join the task already running for key, or start one, so concurrent misses share it"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.ensure_future(fetch())
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so a caller that goes away does not cancel the work for the others
+        return asyncio.shield(task)
+    
     async def get_account_info(self, address: str) -> Dict:
         """Get account information from Sei blockchain"""
+        cached = self._cache_get(self._account_cache, address, self._wallet_ttl)
+        if cached is not None:
+            return cached
+        return await self._single_flight(("account", address), lambda: self._fetch_account_info(address))
+    
+    async def _fetch_account_info(self, address: str) -> Dict:
+        """Fetch and cache account information"""
         try:
-            # Get account balance
-            balance_data = await self._make_request(
-                self.sei_api_endpoints,
-                f"cosmos/bank/v1beta1/balances/{address}"
+            # Get account balance and details concurrently
+            balance_data, account_data = await asyncio.gather(
+                self._make_request(
+                    self.sei_api_endpoints,
+                    f"cosmos/bank/v1beta1/balances/{address}"
+                ),
+                self._make_request(
+                    self.sei_api_endpoints,
+                    f"cosmos/auth/v1beta1/accounts/{address}"
+                ),
+                return_exceptions=True
             )
             
-            # Get account details
-            account_data = await self._make_request(
-                self.sei_api_endpoints,
-                f"cosmos/auth/v1beta1/accounts/{address}"
-            )
+            # Let both requests settle, then fail the lookup as a whole like before
+            for data in (balance_data, account_data):
+                if isinstance(data, BaseException):
+                    raise data
             
             # Parse balance
             sei_balance = 0
             if balance_data.get("balances"):
                 for balance in balance_data["balances"]:
                     if balance["denom"] == self.sei_denom:
-                        sei_balance = int(balance["amount"]) / (10 ** self.sei_decimals)
+                        sei_balance = int(balance["amount"]) / self._usei_divisor
                         break
             
-            return {
+            account_info = {
                 "address": address,
                 "balance_sei": sei_balance,
-                "balance_usei": int(sei_balance * (10 ** self.sei_decimals)),
+                "balance_usei": int(sei_balance * self._usei_divisor),
                 "account_number": account_data.get("account", {}).get("account_number"),
                 "sequence": account_data.get("account", {}).get("sequence"),
                 "balances": balance_data.get("balances", [])
             }
             
+            self._cache_put(self._account_cache, address, account_info)
+            return account_info
+            
         except Exception as e:
-            print(f"Error fetching account info: {e}")
+            logger.warning("Error fetching account info: %s", e)
             return {"address": address, "balance_sei": 0, "balance_usei": 0, "error": str(e)}
     
-    async def get_transactions(self, address: str, limit: int = 100) -> List[Dict]:
-        """Get transaction history for an address"""
-        try:
-            # Get sent transactions
-            sent_txs = await self._make_request(
-                self.sei_api_endpoints,
-                "cosmos/tx/v1beta1/txs",
-                {"events": f"message.sender='{address}'", "limit": limit//2}
+    async def get_transactions(self, address: str, limit: int = 100,
+                               fields: Optional[Tuple[str, ...]] = None) -> List[Dict]:
+        """Get transaction history for an address, optionally keeping only the given fields"""
+        transactions = self._cache_get(self._tx_cache, (address, limit), self._wallet_ttl)
+        if transactions is None:
+            transactions = await self._single_flight(
+                ("transactions", address, limit), lambda: self._fetch_transactions(address, limit)
             )
-            
-            # Get received transactions  
-            received_txs = await self._make_request(
-                self.sei_api_endpoints,
-                "cosmos/tx/v1beta1/txs",
-                {"events": f"transfer.recipient='{address}'", "limit": limit//2}
-            )
-            
-            transactions = []
-            
-            # Process sent transactions
-            if sent_txs.get("txs"):
-                for tx in sent_txs["txs"]:
-                    tx_data = self._parse_transaction(tx, address, "outgoing")
-                    if tx_data:
-                        transactions.append(tx_data)
-            
-            # Process received transactions
-            if received_txs.get("txs"):
-                for tx in received_txs["txs"]:
-                    tx_data = self._parse_transaction(tx, address, "incoming")
-                    if tx_data:
-                        transactions.append(tx_data)
-            
-            # Sort by timestamp
-            transactions.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-            
-            return transactions[:limit]
+        
+        # The cache keeps full records; projections are cut from them per call
+        if fields is None:
+            return transactions
+        return [_project(tx, fields) for tx in transactions]
+    
+    async def _fetch_transactions(self, address: str, limit: int) -> List[Dict]:
+        """Fetch and cache transaction history, or return an empty list if it cannot be fetched"""
+        try:
+            transactions = list(islice(await self._merged_transactions(address, limit), limit))
+            self._cache_put(self._tx_cache, (address, limit), transactions)
+            return transactions
             
         except Exception as e:
-            print(f"Error fetching transactions: {e}")
+            logger.warning("Error fetching transactions: %s", e)
             return []
     
+    async def iter_transactions(self, address: str, limit: int = 100,
+                                fields: Optional[Tuple[str, ...]] = None) -> AsyncIterator[Dict]:
+        """Yield transaction history for an address newest-first, projecting each record as it goes"""
+        # Misses go through the shared, cached fetch so polling the stream does not hit upstream every time
+        for tx in await self.get_transactions(address, limit):
+            yield tx if fields is None else _project(tx, fields)
+    
+    async def _merged_transactions(self, address: str, limit: int) -> Iterator[Dict]:
+        """Fetch sent and received transactions and return a lazy newest-first merge of both"""
+        # Get sent and received transactions concurrently
+        sent_txs, received_txs = await asyncio.gather(
+            self._make_request(
+                self.sei_api_endpoints,
+                _tx_search_path("message.sender", address, limit//2)
+            ),
+            self._make_request(
+                self.sei_api_endpoints,
+                _tx_search_path("transfer.recipient", address, limit//2)
+            ),
+            return_exceptions=True
+        )
+        
+        for data in (sent_txs, received_txs):
+            if isinstance(data, BaseException):
+                raise data
+        
+        # Process sent and received transactions
+        pages = [(sent_txs.get("txs") or [], "outgoing"), (received_txs.get("txs") or [], "incoming")]
+        parsed = self._parse_pages(pages, address)
+        
+        # Pages arrive newest-first, so sorting each is a linear check (and a fix-up for an
+        # endpoint that ignores order_by); then merge the two runs
+        by_timestamp = lambda x: x.get("timestamp", "")
+        for page in parsed:
+            page.sort(key=by_timestamp, reverse=True)
+        return heapq.merge(*parsed, key=by_timestamp, reverse=True)
+    
+    def _parse_pages(self, pages: List[Tuple[List[Dict], str]], address: str) -> List[List[Dict]]:
+        """Parse pages of raw transactions, each paired with its direction, keeping pages apart"""
+        parsed = []
+        for txs, direction in pages:
+            transactions = []
+            for tx in txs:
+                tx_data = self._parse_transaction(tx, address, direction)
+                if tx_data:
+                    transactions.append(tx_data)
+            parsed.append(transactions)
+        return parsed
+    
     def _parse_transaction(self, tx: Dict, address: str, direction: str) -> Optional[Dict]:
         """Parse a transaction from Sei blockchain data"""
         try:
@@ -156,33 +366,28 @@ class SeiLiveAnalyzer:
             amount = 0
             counterparty = ""
             
-            if tx.get("logs"):
-                for log in tx["logs"]:
-                    if log.get("events"):
-                        for event in log["events"]:
-                            if event["type"] == "transfer":
-                                for attr in event.get("attributes", []):
-                                    if attr["key"] == "amount":
-                                        # Parse amount (e.g., "1000000usei")
-                                        amount_str = attr["value"]
-                                        if self.sei_denom in amount_str:
-                                            amount = int(amount_str.replace(self.sei_denom, "")) / (10 ** self.sei_decimals)
-                                    elif attr["key"] == "recipient" and direction == "outgoing":
-                                        counterparty = attr["value"]
-                                    elif attr["key"] == "sender" and direction == "incoming":
-                                        counterparty = attr["value"]
+            counterparty_key = "recipient" if direction == "outgoing" else "sender"
+            
+            for log in tx.get("logs") or ():
+                for event in log.get("events") or ():
+                    if event["type"] != "transfer":
+                        continue
+                    attrs = {attr["key"]: attr["value"] for attr in event.get("attributes", ())}
+                    
+                    # Parse amount (e.g., "1000000usei")
+                    amount_str = attrs.get("amount")
+                    if amount_str is not None and amount_str.endswith(self.sei_denom):
+                        amount = int(amount_str[:-self._denom_suffix_len]) / self._usei_divisor
+                    counterparty = attrs.get(counterparty_key, counterparty)
             
             # Extract transaction type
             tx_type = "transfer"
             if tx.get("tx", {}).get("body", {}).get("messages"):
                 msg = tx["tx"]["body"]["messages"][0]
                 msg_type = msg.get("@type", "")
-                if "staking" in msg_type:
-                    tx_type = "staking"
-                elif "gov" in msg_type:
-                    tx_type = "governance"
-                elif "distribution" in msg_type:
-                    tx_type = "rewards"
+                # e.g. "/cosmos.staking.v1beta1.MsgDelegate" -> "cosmos.staking"
+                module = ".".join(msg_type.lstrip("/").split(".", 2)[:2])
+                tx_type = self._TX_TYPE_MAP.get(module, "transfer")
             
             return {
                 "hash": tx_hash,
@@ -197,7 +402,7 @@ class SeiLiveAnalyzer:
             }
             
         except Exception as e:
-            print(f"Error parsing transaction: {e}")
+            logger.warning("Error parsing transaction: %s", e)
             return None
     
     def _extract_fee(self, tx: Dict) -> float:
@@ -207,54 +412,79 @@ class SeiLiveAnalyzer:
                 fee_amount = tx["tx"]["auth_info"]["fee"]["amount"]
                 if fee_amount and len(fee_amount) > 0:
                     amount = int(fee_amount[0].get("amount", 0))
-                    return amount / (10 ** self.sei_decimals)
+                    return amount / self._usei_divisor
             return 0.0
         except:
             return 0.0
     
+    def _network_stats_fresh(self, entry: Optional[Dict]) -> bool:
+        """Whether cached network stats are still clear of the refresh-ahead window"""
+        if entry is None:
+            return False
+        age = time.time() - entry["timestamp"]
+        return age < self._cache_ttl - self._network_refresh_ahead
+    
     async def get_network_stats(self) -> Dict:
         """Get live Sei network statistics"""
-        cache_key = "network_stats"
-        now = datetime.now().timestamp()
+        entry = self._network_cache.get("network_stats")
+        if entry is None:
+            return await self._refresh_network_stats()
         
-        # Check cache
-        if (cache_key in self._network_cache and 
-            now - self._network_cache[cache_key]["timestamp"] < self._cache_ttl):
-            return self._network_cache[cache_key]["data"]
+        # Close to expiry: keep serving the cached stats while one background task refreshes them
+        if not self._network_stats_fresh(entry) and (
+                self._network_refresh_task is None or self._network_refresh_task.done()):
+            self._network_refresh_task = asyncio.create_task(self._refresh_network_stats())
+        return entry["data"]
+    
+    async def _refresh_network_stats(self) -> Dict:
+        """Fetch network statistics once for all concurrent callers"""
+        async with self._network_lock:
+            # Another caller may have refreshed the stats while this one waited
+            entry = self._network_cache.get("network_stats")
+            if self._network_stats_fresh(entry):
+                return entry["data"]
+            return await self._fetch_network_stats()
+    
+    async def _fetch_network_stats(self) -> Dict:
+        """Fetch live Sei network statistics and cache them"""
+        cache_key = "network_stats"
+        now = time.time()
         
         try:
-            # Get latest block
-            latest_block = await self._make_request(
-                self.sei_api_endpoints,
-                "cosmos/base/tendermint/v1beta1/blocks/latest"
+            # Get latest block, validator set, staking pool and supply concurrently
+            results = await asyncio.gather(
+                self._make_request(
+                    self.sei_api_endpoints,
+                    "cosmos/base/tendermint/v1beta1/blocks/latest"
+                ),
+                self._make_request(
+                    self.sei_api_endpoints,
+                    "cosmos/staking/v1beta1/validators",
+                    {"status": "BOND_STATUS_BONDED"}
+                ),
+                self._make_request(
+                    self.sei_api_endpoints,
+                    "cosmos/staking/v1beta1/pool"
+                ),
+                self._make_request(
+                    self.sei_api_endpoints,
+                    f"cosmos/bank/v1beta1/supply/{self.sei_denom}"
+                ),
+                return_exceptions=True
             )
             
-            # Get validator set
-            validators = await self._make_request(
-                self.sei_api_endpoints,
-                "cosmos/staking/v1beta1/validators",
-                {"status": "BOND_STATUS_BONDED"}
-            )
-            
-            # Get staking pool
-            staking_pool = await self._make_request(
-                self.sei_api_endpoints,
-                "cosmos/staking/v1beta1/pool"
-            )
-            
-            # Get supply
-            supply = await self._make_request(
-                self.sei_api_endpoints,
-                f"cosmos/bank/v1beta1/supply/{self.sei_denom}"
-            )
+            for data in results:
+                if isinstance(data, BaseException):
+                    raise data
+            latest_block, validators, staking_pool, supply = results
             
             # Parse data
             block_height = int(latest_block.get("block", {}).get("header", {}).get("height", 0))
             block_time_str = latest_block.get("block", {}).get("header", {}).get("time", "")
             
             active_validators = len(validators.get("validators", []))
-            total_bonded = int(staking_pool.get("pool", {}).get("bonded_tokens", 0)) / (10 ** self.sei_decimals)
-            total_supply = int(supply.get("amount", {}).get("amount", 0)) / (10 ** self.sei_decimals)
+            total_bonded = int(staking_pool.get("pool", {}).get("bonded_tokens", 0)) / self._usei_divisor
+            total_supply = int(supply.get("amount", {}).get("amount", 0)) / self._usei_divisor
             
             # Calculate staking ratio
             staking_ratio = total_bonded / total_supply if total_supply > 0 else 0
@@ -274,14 +504,15 @@ class SeiLiveAnalyzer:
                 "timestamp": now,
                 "data": network_data
             }
+            self._network_fallback = network_data
             
             return network_data
             
         except Exception as e:
-            print(f"Error fetching network stats: {e}")
-            # Return cached data if available
-            if cache_key in self._network_cache:
-                return self._network_cache[cache_key]["data"]
+            logger.warning("Error fetching network stats: %s", e)
+            # Return the last good data if available
+            if self._network_fallback is not None:
+                return self._network_fallback
             
             # Fallback to estimated data
             return {
@@ -292,24 +523,98 @@ class SeiLiveAnalyzer:
                 "error": str(e)
             }
 
+def _project(tx: Dict, fields: Tuple[str, ...]) -> Dict:
+    """Keep only the requested fields of a parsed transaction"""
+    return {f: tx[f] for f in fields if f in tx}
+
 # Initialize analyzer
 analyzer = SeiLiveAnalyzer()
 
-@mcp.tool()
-async def analyze_wallet_live(address: str) -> dict:
-    """
-    Comprehensive Sei wallet analysis using real blockchain data.
-    
-    Args:
-        address (str): The Sei wallet address to analyze
-    
-    Returns:
-        dict: Comprehensive analysis including real balance, transactions, and network metrics
-    """
+def _risk_factor(n_tx: int, high_failure_rate: bool) -> float:
+    """Wallet risk from transaction activity and failure rate"""
+    risk_factor = 0.3  # Default low risk
+    if n_tx > 1000:
+        risk_factor += 0.3  # High activity
+    if high_failure_rate:
+        risk_factor += 0.2  # High failure rate
+    return min(risk_factor, 1.0)
+
+# Wallet labels in priority order as (label, rule(whale_score, staking_txs, n_tx, balance));
+# the first matching rule wins
+CLASSIFICATION_RULES = (
+    ("Whale", lambda w, s, n, b: w > 0.8),
+    ("Large Holder", lambda w, s, n, b: w > 0.5),
+    ("Active Staker", lambda w, s, n, b: s > 10),
+    ("Active Trader", lambda w, s, n, b: n > 100),
+)
+
+def _classify(whale_score: float, staking_txs: int, n_tx: int, balance: float) -> str:
+    """Label a wallet by the first matching classification rule"""
+    return next(
+        (label for label, rule in CLASSIFICATION_RULES if rule(whale_score, staking_txs, n_tx, balance)),
+        "Regular User"
+    )
+
+# Upper bound on wallets analyzed at once, to avoid hammering the public endpoints
+COMPARE_CONCURRENCY = 8
+
+def _balance_only_analysis(address: str, account_info: Dict, whale_score: float, ts: str) -> dict:
+    """Analysis of a wallet whose balance alone settles the classification"""
+    balance = account_info["balance_sei"]
+    return {
+        "address": address,
+        "analysis_timestamp": ts,
+        "classification": "Whale" if whale_score > 0.8 else "Regular User",
+        "real_data": True,
+        "scores": {
+            "whale_score": round(whale_score, 3),
+            "risk_factor": None,
+            "influence_score": None,
+            "overall_score": None
+        },
+        "wallet_metrics": {
+            "balance_sei": balance,
+            "balance_usei": account_info["balance_usei"],
+            "transaction_count": None,
+            "account_number": account_info.get("account_number"),
+            "sequence": account_info.get("sequence"),
+            "staking_transactions": None,
+            "reward_transactions": None
+        },
+        "transaction_analysis": "not_evaluated",
+        "recent_transactions": None,
+        "recommendations": [
+            "High-value wallet - monitor for large movements"
+        ] if whale_score > 0.7 else []
+    }
+
+async def _analyze_wallet(address: str, quick: bool = False) -> dict:
+    """Run the live wallet analysis; shared by the wallet and comparison tools"""
+    cached = analyzer._cache_get(analyzer._wallet_cache, address, analyzer._wallet_ttl)
+    if cached is not None:
+        return cached
     
+    # Concurrent requests for the same wallet share one analysis
+    return await analyzer._single_flight(("wallet", address, quick), lambda: _analyze_wallet_uncached(address, quick))
+
+async def _analyze_wallet_uncached(address: str, quick: bool) -> dict:
+    """Fetch and score a wallet, caching the full analysis"""
+    ts = datetime.now().isoformat()
     try:
-        # Get real account data
-        account_info = await analyzer.get_account_info(address)
+        if quick:
+            # Fetch the balance first; whales and empty wallets need no transaction history
+            account_info = await analyzer.get_account_info(address)
+            if "error" not in account_info:
+                whale_score = min(account_info["balance_sei"] / 10000000, 1.0)
+                if whale_score > 0.8 or account_info["balance_sei"] == 0:
+                    return _balance_only_analysis(address, account_info, whale_score, ts)
+                transactions = await analyzer.get_transactions(address, limit=100)
+        else:
+            # Get real account data and transaction history concurrently; neither depends on the other
+            account_info, transactions = await asyncio.gather(
+                analyzer.get_account_info(address),
+                analyzer.get_transactions(address, limit=100)
+            )
         
         if "error" in account_info:
             return {
@@ -318,49 +623,42 @@ async def analyze_wallet_live(address: str) -> dict:
                 "status": "failed"
             }
         
-        # Get transaction history
-        transactions = await analyzer.get_transactions(address, limit=100)
-        
         balance = account_info["balance_sei"]
         
         # Calculate metrics using real data
         whale_score = balance / 10000000  # Score based on 10M SEI threshold
         whale_score = min(whale_score, 1.0)
         
-        # Risk analysis based on transaction patterns
-        risk_factor = 0.3  # Default low risk
-        if len(transactions) > 1000:
-            risk_factor += 0.3  # High activity
-        
-        failed_txs = len([tx for tx in transactions if tx.get("status") == "failed"])
-        if failed_txs > len(transactions) * 0.1:
-            risk_factor += 0.2  # High failure rate
+        # Tally status, volume and type in a single pass over the transactions
+        n_tx = len(transactions)
+        successful_txs = failed_txs = staking_txs = reward_txs = 0
+        total_volume = 0
+        for tx in transactions:
+            status = tx.get("status")
+            if status == "success":
+                successful_txs += 1
+            elif status == "failed":
+                failed_txs += 1
+            total_volume += tx.get("amount", 0)
+            tx_type = tx.get("tx_type")
+            if tx_type == "staking":
+                staking_txs += 1
+            elif tx_type == "rewards":
+                reward_txs += 1
         
-        risk_factor = min(risk_factor, 1.0)
+        # Risk analysis based on transaction patterns
+        high_failure_rate = failed_txs > n_tx * 0.1
+        risk_factor = _risk_factor(n_tx, high_failure_rate)
         
         # Calculate influence based on transaction volume
-        total_volume = sum(tx.get("amount", 0) for tx in transactions)
         influence_score = min(total_volume / balance if balance > 0 else 0, 1.0) * 0.5
         
-        # Analyze transaction patterns
-        staking_txs = [tx for tx in transactions if tx.get("tx_type") == "staking"]
-        reward_txs = [tx for tx in transactions if tx.get("tx_type") == "rewards"]
-        
         # Classification
-        if whale_score > 0.8:
-            classification = "Whale"
-        elif whale_score > 0.5:
-            classification = "Large Holder"
-        elif len(staking_txs) > 10:
-            classification = "Active Staker"
-        elif len(transactions) > 100:
-            classification = "Active Trader"
-        else:
-            classification = "Regular User"
+        classification = _classify(whale_score, staking_txs, n_tx, balance)
         
         result = {
             "address": address,
-            "analysis_timestamp": datetime.now().isoformat(),
+            "analysis_timestamp": ts,
             "classification": classification,
             "real_data": True,
             "scores": {
@@ -372,29 +670,30 @@ async def analyze_wallet_live(address: str) -> dict:
             "wallet_metrics": {
                 "balance_sei": balance,
                 "balance_usei": account_info["balance_usei"],
-                "transaction_count": len(transactions),
+                "transaction_count": n_tx,
                 "account_number": account_info.get("account_number"),
                 "sequence": account_info.get("sequence"),
-                "staking_transactions": len(staking_txs),
-                "reward_transactions": len(reward_txs)
+                "staking_transactions": staking_txs,
+                "reward_transactions": reward_txs
             },
             "transaction_analysis": {
-                "total_transactions": len(transactions),
-                "successful_transactions": len([tx for tx in transactions if tx.get("status") == "success"]),
+                "total_transactions": n_tx,
+                "successful_transactions": successful_txs,
                 "failed_transactions": failed_txs,
                 "total_volume_sei": round(total_volume, 6),
-                "average_transaction_amount": round(total_volume / len(transactions), 6) if transactions else 0,
+                "average_transaction_amount": round(total_volume / n_tx, 6) if transactions else 0,
                 "latest_transaction": transactions[0].get("timestamp") if transactions else None
             },
             "recent_transactions": transactions[:5],  # Last 5 transactions
             "recommendations": [r for r in [
                 "High-value wallet - monitor for large movements" if whale_score > 0.7 else None,
-                "Active staker - earning rewards" if len(staking_txs) > 5 else None,
-                "Consider staking for rewards" if len(staking_txs) == 0 and balance > 1000 else None,
-                "High transaction failure rate" if failed_txs > len(transactions) * 0.1 else None
+                "Active staker - earning rewards" if staking_txs > 5 else None,
+                "Consider staking for rewards" if staking_txs == 0 and balance > 1000 else None,
+                "High transaction failure rate" if high_failure_rate else None
             ] if r is not None]
         }
         
+        analyzer._cache_put(analyzer._wallet_cache, address, result)
         return result
         
     except Exception as e:
@@ -402,9 +701,25 @@ async def analyze_wallet_live(address: str) -> dict:
             "address": address,
             "error": str(e),
             "status": "failed",
-            "analysis_timestamp": datetime.now().isoformat()
+            "analysis_timestamp": ts
         }
 
+@mcp.tool()
+async def analyze_wallet_live(address: str, quick: bool = False) -> dict:
+    """
+    Comprehensive Sei wallet analysis using real blockchain data.
+    
+    Args:
+        address (str): The Sei wallet address to analyze
+        quick (bool, optional): Skip the transaction history when the balance alone
+            decides the classification (whales and empty wallets)
+    
+    Returns:
+        dict: Comprehensive analysis including real balance, transactions, and network metrics
+    """
+    
+    return await _analyze_wallet(address, quick)
+
 @mcp.tool()
 async def get_sei_network_health() -> dict:
     """
@@ -414,6 +729,10 @@ async def get_sei_network_health() -> dict:
         dict: Live network health metrics from Sei blockchain
     """
     
+    return await _network_health()
+
+async def _network_health() -> dict:
+    """Score live network health; shared by the MCP tool and the HTTP API"""
     try:
         network_stats = await analyzer.get_network_stats()
         
@@ -467,38 +786,47 @@ async def compare_sei_addresses(addresses: List[str]) -> dict:
         dict: Comparison analysis between addresses using live data
     """
     
+    return await _compare_addresses(addresses)
+
+async def _compare_addresses(addresses: List[str]) -> dict:
+    """Compare wallets fetched concurrently; shared by the MCP tool and the HTTP API"""
     if len(addresses) < 2:
         return {"error": "At least 2 addresses required for comparison"}
     
     try:
-        analyses = []
+        semaphore = asyncio.Semaphore(COMPARE_CONCURRENCY)
+        
+        async def analyze(address: str) -> dict:
+            async with semaphore:
+                return await _analyze_wallet(address)
         
-        # Analyze each address
-        for address in addresses:
-            analysis = await analyze_wallet_live(address)
-            if "error" not in analysis:
-                analyses.append(analysis)
+        # Analyze all addresses concurrently, keeping the input order
+        results = await asyncio.gather(*(analyze(a) for a in addresses), return_exceptions=True)
+        analyses = [r for r in results if isinstance(r, dict) and "error" not in r]
         
         if len(analyses) < 2:
             return {"error": "Could not analyze enough addresses for comparison"}
         
         # Extract metrics for comparison
-        balances = [a["wallet_metrics"]["balance_sei"] for a in analyses]
-        whale_scores = [a["scores"]["whale_score"] for a in analyses]
-        tx_counts = [a["wallet_metrics"]["transaction_count"] for a in analyses]
+        n = len(analyses)
+        balances = np.fromiter((a["wallet_metrics"]["balance_sei"] for a in analyses), dtype=np.float64, count=n)
+        whale_scores = np.fromiter((a["scores"]["whale_score"] for a in analyses), dtype=np.float64, count=n)
+        tx_counts = np.fromiter((a["wallet_metrics"]["transaction_count"] for a in analyses), dtype=np.int64, count=n)
         
         # Find patterns
-        balance_similarity = statistics.stdev(balances) / statistics.mean(balances) if statistics.mean(balances) > 0 else 1
+        average_balance = float(balances.mean())
+        total_balance = float(balances.sum())
+        balance_similarity = float(balances.std(ddof=1)) / average_balance if average_balance > 0 else 1
         
         return {
             "comparison_summary": {
-                "total_addresses": len(analyses),
-                "successful_analyses": len(analyses),
-                "highest_balance": max(balances),
-                "lowest_balance": min(balances),
-                "average_balance": round(statistics.mean(balances), 6),
-                "highest_whale_score": max(whale_scores),
-                "total_combined_balance": sum(balances),
+                "total_addresses": n,
+                "successful_analyses": n,
+                "highest_balance": float(balances.max()),
+                "lowest_balance": float(balances.min()),
+                "average_balance": round(average_balance, 6),
+                "highest_whale_score": float(whale_scores.max()),
+                "total_combined_balance": total_balance,
                 "balance_similarity_score": round(1 - min(balance_similarity, 1), 3)
             },
             "individual_analysis": [{
@@ -510,10 +838,10 @@ async def compare_sei_addresses(addresses: List[str]) -> dict:
                 "risk_factor": a["scores"]["risk_factor"]
             } for a in analyses],
             "insights": {
-                "whale_addresses": len([s for s in whale_scores if s > 0.7]),
-                "high_activity_addresses": len([t for t in tx_counts if t > 100]),
+                "whale_addresses": int((whale_scores > 0.7).sum()),
+                "high_activity_addresses": int((tx_counts > 100).sum()),
                 "potential_related_addresses": "Possible" if balance_similarity < 0.3 else "Unlikely",
-                "combined_influence": "High" if sum(balances) > 1000000 else "Medium" if sum(balances) > 100000 else "Low"
+                "combined_influence": "High" if total_balance > 1000000 else "Medium" if total_balance > 100000 else "Low"
             },
             "real_data": True,
             "analysis_timestamp": datetime.now().isoformat()
@@ -527,5 +855,22 @@ async def compare_sei_addresses(addresses: List[str]) -> dict:
             "analysis_timestamp": datetime.now().isoformat()
         }
 
+def _configure_logging() -> logging.handlers.QueueListener:
+    """Send log records through a queue so writing to stderr never blocks the event loop"""
+    log_queue = queue.SimpleQueue()
+    stderr_handler = logging.StreamHandler(sys.stderr)
+    stderr_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    root = logging.getLogger()
+    root.setLevel(logging.WARNING)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(log_queue, stderr_handler)
+    listener.start()
+    return listener
+
 if __name__ == "__main__":
-    mcp.run(transport="stdio")
+    listener = _configure_logging()
+    try:
+        mcp.run(transport="stdio")
+    finally:
+        listener.stop()
@@ -8,28 +8,67 @@ import asyncio
 import json
 import sys
 import os
-from datetime import datetime
-from typing import Dict, Any, List
+from contextlib import asynccontextmanager
+from typing import Dict, Any, List, Optional, Tuple
 
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field, field_validator
 import uvicorn
 
 # Add the MCP server directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# cosmpy, imported by the analyzer, appends its bundled protos to sys.path; keep the path from before
+_SYS_PATH = list(sys.path)
 
-# Import our live MCP server components
-from analyze_server_live import SeiLiveAnalyzer
+# Import our live MCP server components; sharing its analyzer means one set of network stats
+# and per-address caches (and one connection pool) serves every endpoint. The endpoints call
+# the plain coroutines behind the MCP tools, since fastmcp's tool objects are not callable
+from analyze_server_live import analyzer, _analyze_wallet, _compare_addresses, _network_health
+from orjson_response import ORJSONResponse, dumps
 
-# Create FastAPI app
+class WalletRequest(BaseModel):
+    """Body of /analyze/wallet"""
+    address: str = Field(min_length=1)
+
+class CompareRequest(BaseModel):
+    """Body of /analyze/compare"""
+    addresses: List[str]
+
+    @field_validator("addresses")
+    @classmethod
+    def at_least_two(cls, addresses):
+        if len(addresses) < 2:
+            raise ValueError("At least 2 addresses required")
+        return addresses
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close the shared analyzer's pooled HTTP client and background tasks on shutdown"""
+    try:
+        yield
+    finally:
+        await analyzer.aclose()
+
+# Interactive docs and the OpenAPI schema are only served when DEBUG is 1/true/yes
+DEBUG = os.environ.get("DEBUG", "").strip().lower() in ("1", "true", "yes")
+
+# Create FastAPI app; the heavy endpoints return ORJSONResponse themselves, which skips
+# FastAPI's jsonable_encoder pass over their already JSON-ready results
 app = FastAPI(
     title="Sei Network Live Analyzer API",
     description="HTTP API for real-time Sei blockchain analysis",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+    docs_url="/docs" if DEBUG else None,
+    redoc_url="/redoc" if DEBUG else None,
+    openapi_url="/openapi.json" if DEBUG else None
 )
 
-# Initialize live analyzer
-analyzer = SeiLiveAnalyzer()
+# Wallet, comparison and transaction payloads run to tens of KB; small replies go out uncompressed
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 @app.get("/")
 async def root():
@@ -47,99 +86,16 @@ async def health():
     return {"status": "healthy", "service": "sei-network-live-analyzer"}
 
 @app.post("/analyze/wallet")
-async def analyze_wallet_endpoint(request: Request):
+async def analyze_wallet_endpoint(req: WalletRequest):
     """Analyze a single wallet address using live blockchain data"""
     try:
-        body = await request.json()
-        address = body.get("address")
-        
-        if not address:
-            raise HTTPException(status_code=400, detail="Address is required")
-        
-        # Get real account data directly
-        account_info = await analyzer.get_account_info(address)
-        
-        if "error" in account_info:
-            raise HTTPException(status_code=500, detail=account_info["error"])
-        
-        # Get transaction history
-        transactions = await analyzer.get_transactions(address, limit=100)
-        
-        balance = account_info["balance_sei"]
+        # Same cached, single-flight analysis as the MCP tool
+        result = await _analyze_wallet(req.address)
         
-        # Calculate metrics using real data
-        whale_score = balance / 10000000  # Score based on 10M SEI threshold
-        whale_score = min(whale_score, 1.0)
-        
-        # Risk analysis based on transaction patterns
-        risk_factor = 0.3  # Default low risk
-        if len(transactions) > 1000:
-            risk_factor += 0.3  # High activity
-        
-        failed_txs = len([tx for tx in transactions if tx.get("status") == "failed"])
-        if failed_txs > len(transactions) * 0.1:
-            risk_factor += 0.2  # High failure rate
-        
-        risk_factor = min(risk_factor, 1.0)
-        
-        # Calculate influence based on transaction volume
-        total_volume = sum(tx.get("amount", 0) for tx in transactions)
-        influence_score = min(total_volume / balance if balance > 0 else 0, 1.0) * 0.5
-        
-        # Analyze transaction patterns
-        staking_txs = [tx for tx in transactions if tx.get("tx_type") == "staking"]
-        reward_txs = [tx for tx in transactions if tx.get("tx_type") == "rewards"]
-        
-        # Classification
-        if whale_score > 0.8:
-            classification = "Whale"
-        elif whale_score > 0.5:
-            classification = "Large Holder"
-        elif len(staking_txs) > 10:
-            classification = "Active Staker"
-        elif len(transactions) > 100:
-            classification = "Active Trader"
-        else:
-            classification = "Regular User"
-        
-        result = {
-            "address": address,
-            "analysis_timestamp": datetime.now().isoformat(),
-            "classification": classification,
-            "real_data": True,
-            "scores": {
-                "whale_score": round(whale_score, 3),
-                "risk_factor": round(risk_factor, 3),
-                "influence_score": round(influence_score, 3),
-                "overall_score": round((whale_score * 0.4 + (1-risk_factor) * 0.3 + influence_score * 0.3), 3)
-            },
-            "wallet_metrics": {
-                "balance_sei": balance,
-                "balance_usei": account_info["balance_usei"],
-                "transaction_count": len(transactions),
-                "account_number": account_info.get("account_number"),
-                "sequence": account_info.get("sequence"),
-                "staking_transactions": len(staking_txs),
-                "reward_transactions": len(reward_txs)
-            },
-            "transaction_analysis": {
-                "total_transactions": len(transactions),
-                "successful_transactions": len([tx for tx in transactions if tx.get("status") == "success"]),
-                "failed_transactions": failed_txs,
-                "total_volume_sei": round(total_volume, 6),
-                "average_transaction_amount": round(total_volume / len(transactions), 6) if transactions else 0,
-                "latest_transaction": transactions[0].get("timestamp") if transactions else None
-            },
-            "recent_transactions": transactions[:5],  # Last 5 transactions
-            "recommendations": [r for r in [
-                "High-value wallet - monitor for large movements" if whale_score > 0.7 else None,
-                "Active staker - earning rewards" if len(staking_txs) > 5 else None,
-                "Consider staking for rewards" if len(staking_txs) == 0 and balance > 1000 else None,
-                "High transaction failure rate" if failed_txs > len(transactions) * 0.1 else None
-            ] if r is not None]
-        }
+        if "error" in result:
+            raise HTTPException(status_code=500, detail=result["error"])
             
-        return JSONResponse(content=result)
+        return ORJSONResponse(result)
     
     except HTTPException:
         raise
@@ -147,67 +103,58 @@ async def analyze_wallet_endpoint(request: Request):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/analyze/compare")
-async def compare_wallets_endpoint(request: Request):
+async def compare_wallets_endpoint(req: CompareRequest):
     """Compare multiple wallet addresses using live blockchain data"""
     try:
-        body = await request.json()
-        addresses = body.get("addresses", [])
-        
-        if not addresses or len(addresses) < 2:
-            raise HTTPException(status_code=400, detail="At least 2 addresses required")
-        
-        # Import and use the live comparison function
-        from analyze_server_live import compare_sei_addresses
-        result = await compare_sei_addresses(addresses)
+        # Fetch and compare all addresses concurrently through the live analyzer
+        result = await _compare_addresses(req.addresses)
         
         if "error" in result:
             raise HTTPException(status_code=500, detail=result["error"])
             
-        return JSONResponse(content=result)
+        return ORJSONResponse(result)
     
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def _block_etag(network_stats: Dict) -> str:
+    """Weak ETag for a network response; its content only changes with the block height"""
+    return f'W/"{network_stats.get("block_height", 0)}"'
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match already covers the given ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as RFC 9110 requires for If-None-Match
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+# Pollers may reuse a network response for a second, then revalidate with its ETag
+_NETWORK_CACHE_CONTROL = "public, max-age=1"
+
 @app.get("/network/health")
-async def network_health_endpoint():
+async def network_health_endpoint(request: Request):
     """Get live Sei network health status"""
     try:
         # Get network stats directly from analyzer
         network_stats = await analyzer.get_network_stats()
         
-        # Calculate health score
-        staking_ratio = network_stats.get("staking_ratio", 0.65)
-        active_validators = network_stats.get("active_validators", 100)
-        
-        health_score = (
-            min(staking_ratio / 0.6, 1.0) * 0.4 +  # Target 60%+ staking
-            min(active_validators / 80, 1.0) * 0.4 +  # Target 80+ validators
-            0.2  # Base score
-        )
+        etag = _block_etag(network_stats)
+        headers = {"ETag": etag, "Cache-Control": _NETWORK_CACHE_CONTROL}
+        if _not_modified(request, etag):
+            return Response(status_code=304, headers=headers)
         
-        health_status = "Excellent" if health_score > 0.9 else "Good" if health_score > 0.7 else "Fair"
+        # Stats are cached, so the shared scorer below reuses the snapshot the ETag was taken from
+        result = await _network_health()
+        if "error" in result:
+            raise HTTPException(status_code=500, detail=result["error"])
         
-        result = {
-            "network_health": {
-                "overall_score": round(health_score, 3),
-                "status": health_status,
-                "chain_id": network_stats.get("chain_id", "pacific-1"),
-                "last_updated": datetime.now().isoformat()
-            },
-            "live_metrics": network_stats,
-            "analysis": {
-                "staking_participation": f"{staking_ratio:.1%}",
-                "validator_count": active_validators,
-                "network_security": "High" if staking_ratio > 0.6 else "Medium",
-                "latest_block": network_stats.get("block_height", 0)
-            },
-            "real_data": True,
-            "data_source": "sei-blockchain-apis"
-        }
-            
-        return JSONResponse(content=result)
+        return ORJSONResponse(result, headers=headers)
     
     except HTTPException:
         raise
@@ -215,15 +162,21 @@ async def network_health_endpoint():
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/network/stats")
-async def network_stats_endpoint():
+async def network_stats_endpoint(request: Request):
     """Get detailed Sei network statistics"""
     try:
         stats = await analyzer.get_network_stats()
-        return JSONResponse(content={
+        
+        etag = _block_etag(stats)
+        headers = {"ETag": etag, "Cache-Control": _NETWORK_CACHE_CONTROL}
+        if _not_modified(request, etag):
+            return Response(status_code=304, headers=headers)
+        
+        return ORJSONResponse({
             "network_stats": stats,
             "real_data": True,
             "timestamp": analyzer._network_cache.get("network_stats", {}).get("timestamp")
-        })
+        }, headers=headers)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -237,23 +190,29 @@ async def get_account_endpoint(address: str):
         if "error" in account_info:
             raise HTTPException(status_code=404, detail=account_info["error"])
             
-        return JSONResponse(content=account_info)
+        return account_info
     
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def _parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Split a comma-separated ?fields= projection; None keeps whole records"""
+    if not fields:
+        return None
+    return tuple(f for f in (f.strip() for f in fields.split(",")) if f)
+
 @app.get("/transactions/{address}")
-async def get_transactions_endpoint(address: str, limit: int = 50):
-    """Get transaction history for an address"""
+async def get_transactions_endpoint(address: str, limit: int = 50, fields: Optional[str] = None):
+    """Get transaction history for an address, optionally only the comma-separated fields"""
     try:
         if limit > 200:
             limit = 200  # Maximum limit
             
-        transactions = await analyzer.get_transactions(address, limit)
+        transactions = await analyzer.get_transactions(address, limit, _parse_fields(fields))
         
-        return JSONResponse(content={
+        return ORJSONResponse({
             "address": address,
             "transactions": transactions,
             "count": len(transactions),
@@ -264,54 +223,72 @@ async def get_transactions_endpoint(address: str, limit: int = 50):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/transactions/{address}/stream")
+async def stream_transactions_endpoint(address: str, limit: int = 50, fields: Optional[str] = None):
+    """Stream transaction history for an address as newline-delimited JSON"""
+    if limit > 200:
+        limit = 200  # Maximum limit
+    projection = _parse_fields(fields)
+    
+    async def ndjson():
+        async for tx in analyzer.iter_transactions(address, limit, projection):
+            yield dumps(tx) + b"\n"
+    
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+# The tools/list payload never changes, so encode it once at import
+_TOOLS_LIST_RESULT = dumps({
+    "tools": [
+        {
+            "name": "analyze_wallet_live",
+            "description": "Comprehensive analysis of a Sei wallet using real blockchain data"
+        },
+        {
+            "name": "compare_sei_addresses", 
+            "description": "Compare multiple Sei addresses using live blockchain data"
+        },
+        {
+            "name": "get_sei_network_health",
+            "description": "Get real-time Sei network health and statistics"
+        }
+    ]
+})
+
 @app.post("/mcp")
 async def mcp_endpoint(request: Request):
     """MCP JSON-RPC endpoint for compatibility with live data"""
+    request_id = 1  # Reported in error replies when the body cannot be read
     try:
         body = await request.json()
+        request_id = body.get("id", 1)
         method = body.get("method")
         params = body.get("params", {})
-        request_id = body.get("id", 1)
         
         if method == "tools/list":
-            result = {
-                "tools": [
-                    {
-                        "name": "analyze_wallet_live",
-                        "description": "Comprehensive analysis of a Sei wallet using real blockchain data"
-                    },
-                    {
-                        "name": "compare_sei_addresses", 
-                        "description": "Compare multiple Sei addresses using live blockchain data"
-                    },
-                    {
-                        "name": "get_sei_network_health",
-                        "description": "Get real-time Sei network health and statistics"
-                    }
-                ]
-            }
-            
+            # Only the id varies, so splice it into the pre-encoded result
+            return Response(
+                content=b'{"jsonrpc":"2.0","id":%s,"result":%s}' % (dumps(request_id), _TOOLS_LIST_RESULT),
+                media_type="application/json"
+            )
+
         elif method == "tools/call":
             tool_name = params.get("name")
             tool_args = params.get("arguments", {})
             
             if tool_name == "analyze_wallet_live":
-                from analyze_server_live import analyze_wallet_live
                 address = tool_args.get("address")
                 if not address:
                     raise HTTPException(status_code=400, detail="Address is required")
-                result = await analyze_wallet_live(address)
+                result = await _analyze_wallet(address)
                 
             elif tool_name == "compare_sei_addresses":
-                from analyze_server_live import compare_sei_addresses
                 addresses = tool_args.get("addresses", [])
                 if len(addresses) < 2:
                     raise HTTPException(status_code=400, detail="At least 2 addresses required")
-                result = await compare_sei_addresses(addresses)
+                result = await _compare_addresses(addresses)
                 
             elif tool_name == "get_sei_network_health":
-                from analyze_server_live import get_sei_network_health
-                result = await get_sei_network_health()
+                result = await _network_health()
                 
             else:
                 raise HTTPException(status_code=400, detail=f"Unknown tool: {tool_name}")
@@ -328,7 +305,7 @@ async def mcp_endpoint(request: Request):
     except HTTPException as e:
         return {
             "jsonrpc": "2.0",
-            "id": body.get("id", 1) if 'body' in locals() else 1,
+            "id": request_id,
             "error": {
                 "code": e.status_code,
                 "message": str(e.detail)
@@ -337,7 +314,7 @@ async def mcp_endpoint(request: Request):
     except Exception as e:
         return {
             "jsonrpc": "2.0",
-            "id": body.get("id", 1) if 'body' in locals() else 1,
+            "id": request_id,
             "error": {
                 "code": -32603,
                 "message": str(e)
@@ -346,4 +323,11 @@ async def mcp_endpoint(request: Request):
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Each worker is a separate process with its own caches; WEB_CONCURRENCY overrides the default
+    workers = int(os.environ.get("WEB_CONCURRENCY", min(os.cpu_count() or 1, 4)))
+    # Spawned workers inherit sys.path, and with cosmpy's protos already on it google.protobuf would
+    # resolve to the bundled stub package; hand them the path from before cosmpy was imported
+    sys.path[:] = _SYS_PATH
+    # "auto" picks uvloop and httptools when installed (uvicorn[standard]) and falls back to asyncio/h11
+    uvicorn.run("analyze_server_live_http:app", host="0.0.0.0", port=port, workers=workers,
+                loop="auto", http="auto", access_log=False, log_level="warning")
@@ -8,25 +8,55 @@ import asyncio
 import json
 import sys
 import os
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
+from pydantic import BaseModel, Field, field_validator
 import uvicorn
 
 # Add the MCP server directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Import our MCP server components
-from analyze_server import SeiAnalyzer, analyzer
+# Import our MCP server components and the tool functions the endpoints call
+from analyze_server import SeiAnalyzer, analyzer, analyze_wallet, compare_addresses, analyze_network_health
+from orjson_response import ORJSONResponse, dumps
+
+class WalletRequest(BaseModel):
+    """Body of /analyze/wallet"""
+    address: str = Field(min_length=1)
+    balance: float = Field(1000000, ge=0)  # Default balance for demo
+    transactions: List[Dict[str, Any]] = []
+
+class CompareRequest(BaseModel):
+    """Body of /analyze/compare"""
+    addresses: List[Dict[str, Any]]
+
+    @field_validator("addresses")
+    @classmethod
+    def at_least_two(cls, addresses):
+        if len(addresses) < 2:
+            raise ValueError("At least 2 addresses required")
+        return addresses
+
+# Interactive docs and the OpenAPI schema are only served when DEBUG is 1/true/yes
+DEBUG = os.environ.get("DEBUG", "").strip().lower() in ("1", "true", "yes")
 
 # Create FastAPI app
 app = FastAPI(
     title="Sei Network Analyzer API",
     description="HTTP API for Sei blockchain wallet analysis",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    docs_url="/docs" if DEBUG else None,
+    redoc_url="/redoc" if DEBUG else None,
+    openapi_url="/openapi.json" if DEBUG else None
 )
 
+# Wallet and comparison payloads can run to tens of KB; small replies go out uncompressed
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -38,47 +68,29 @@ async def health():
     return {"status": "healthy", "service": "sei-network-analyzer"}
 
 @app.post("/analyze/wallet")
-async def analyze_wallet_endpoint(request: Request):
+async def analyze_wallet_endpoint(req: WalletRequest):
     """Analyze a single wallet address"""
     try:
-        body = await request.json()
-        address = body.get("address")
-        balance = body.get("balance", 1000000)  # Default balance for demo
-        transactions = body.get("transactions", [])
-        
-        if not address:
-            raise HTTPException(status_code=400, detail="Address is required")
-        
         # Create wallet data in the format expected by the MCP tool
         wallet_data = {
-            "address": address,
-            "balance": balance,
-            "transactions": transactions
+            "address": req.address,
+            "balance": req.balance,
+            "transactions": req.transactions
         }
         
-        # Import the actual MCP tool function 
-        from analyze_server import analyze_wallet
         result = await analyze_wallet(wallet_data)
-        return JSONResponse(content=result)
+        return result
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/analyze/compare")
-async def compare_wallets_endpoint(request: Request):
+async def compare_wallets_endpoint(req: CompareRequest):
     """Compare multiple wallet addresses"""
     try:
-        body = await request.json()
-        addresses = body.get("addresses", [])
-        
-        if not addresses or len(addresses) < 2:
-            raise HTTPException(status_code=400, detail="At least 2 addresses required")
-        
-        # Import the actual MCP tool function
-        from analyze_server import compare_addresses
-        address_data = {"addresses": addresses}
+        address_data = {"addresses": req.addresses}
         result = await compare_addresses(address_data)
-        return JSONResponse(content=result)
+        return result
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -87,57 +99,60 @@ async def compare_wallets_endpoint(request: Request):
 async def network_health_endpoint():
     """Get Sei network health status"""
     try:
-        # Import the actual MCP tool function
-        from analyze_server import analyze_network_health
         result = await analyze_network_health()
-        return JSONResponse(content=result)
+        return result
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# The tools/list payload never changes, so encode it once at import
+_TOOLS_LIST_RESULT = dumps({
+    "tools": [
+        {
+            "name": "analyze_wallet",
+            "description": "Comprehensive analysis of a Sei wallet address including risk assessment, whale scoring, and transaction patterns"
+        },
+        {
+            "name": "compare_addresses", 
+            "description": "Compare multiple wallet addresses to identify patterns, connections, and risk factors"
+        },
+        {
+            "name": "analyze_network_health",
+            "description": "Monitor Sei network health, performance metrics, and validator status"
+        }
+    ]
+})
+
 @app.post("/mcp")
 async def mcp_endpoint(request: Request):
     """MCP JSON-RPC endpoint for compatibility"""
+    request_id = 1  # Reported in error replies when the body cannot be read
     try:
         body = await request.json()
+        request_id = body.get("id", 1)
         method = body.get("method")
         params = body.get("params", {})
-        request_id = body.get("id", 1)
         
         if method == "tools/list":
-            result = {
-                "tools": [
-                    {
-                        "name": "analyze_wallet",
-                        "description": "Comprehensive analysis of a Sei wallet address including risk assessment, whale scoring, and transaction patterns"
-                    },
-                    {
-                        "name": "compare_addresses", 
-                        "description": "Compare multiple wallet addresses to identify patterns, connections, and risk factors"
-                    },
-                    {
-                        "name": "analyze_network_health",
-                        "description": "Monitor Sei network health, performance metrics, and validator status"
-                    }
-                ]
-            }
-            
+            # Only the id varies, so splice it into the pre-encoded result
+            return Response(
+                content=b'{"jsonrpc":"2.0","id":%s,"result":%s}' % (dumps(request_id), _TOOLS_LIST_RESULT),
+                media_type="application/json"
+            )
+
         elif method == "tools/call":
             tool_name = params.get("name")
             tool_args = params.get("arguments", {})
             
             if tool_name == "analyze_wallet":
-                from analyze_server import analyze_wallet
                 wallet_data = tool_args.get("walletData", {})
                 result = await analyze_wallet(wallet_data)
                 
             elif tool_name == "compare_addresses":
-                from analyze_server import compare_addresses
                 address_data = tool_args.get("addressData", {})
                 result = await compare_addresses(address_data)
                 
             elif tool_name == "analyze_network_health":
-                from analyze_server import analyze_network_health
                 result = await analyze_network_health()
                 
             else:
@@ -155,7 +170,7 @@ async def mcp_endpoint(request: Request):
     except Exception as e:
         return {
             "jsonrpc": "2.0",
-            "id": body.get("id", 1) if 'body' in locals() else 1,
+            "id": request_id,
             "error": {
                 "code": -32603,
                 "message": str(e)
@@ -164,4 +179,8 @@ async def mcp_endpoint(request: Request):
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Each worker is a separate process with its own caches; WEB_CONCURRENCY overrides the default
+    workers = int(os.environ.get("WEB_CONCURRENCY", min(os.cpu_count() or 1, 4)))
+    # "auto" picks uvloop and httptools when installed (uvicorn[standard]) and falls back to asyncio/h11
+    uvicorn.run("analyze_server_simple_http:app", host="0.0.0.0", port=port, workers=workers,
+                loop="auto", http="auto", access_log=False, log_level="warning")
@@ -0,0 +1,42 @@
+"""
+JSON response class for the Sei Network Analyzer HTTP servers
+Renders with orjson when it is installed and falls back to the stdlib encoder
+"""
+
+import json
+from typing import Any
+
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """Encode content to compact UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(
+            content,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    # Same encoding as Starlette's JSONResponse
+    return json.dumps(
+        content,
+        default=str,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":")
+    ).encode("utf-8")
+
+
+class ORJSONResponse(Response):
+    """JSON response rendered by orjson, or by stdlib json when orjson is unavailable"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
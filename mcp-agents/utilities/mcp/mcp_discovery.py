@@ -4,6 +4,12 @@ import json
 import os
 from typing import Any, Dict
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class MCPDiscovery:
     """
@@ -21,16 +27,14 @@ class MCPDiscovery:
         Args:
             config_file (str): Path to the JSON configuration file. If None, defaults to 'utilities/mcp_config.json'.
         """
-        if config_file is None:
-            self.config_file = os.path.join(os.path.dirname(__file__), 'mcp_config.json')
-        
+        self.config_file = config_file or os.path.join(os.path.dirname(__file__), 'mcp_config.json')
         self.config = self._load_config()
     
     def _load_config(self) -> Dict[str, Any]:
         try:
-            with open(self.config_file, 'r') as file:
-                data = json.load(file)
-        
+            with open(self.config_file, 'rb') as file:
+                data = _json_loads(file.read())
+
             if not isinstance(data, dict):
                 raise ValueError("Invalid MCP configuration file format.")
 